@@ -13,6 +13,7 @@ import logging
 import os
 import sys
 import tempfile
+import threading
 import time
 from collections import defaultdict
 from datetime import datetime
@@ -40,6 +41,9 @@ VULNERABILITY_BATCH_SIZE = (
 )
 API_PAGE_SIZE = 5000  # Number of items to fetch per page for subdomain API calls
 
+# pyplot keeps global figure state, so charts from concurrent reports must be serialized
+_PYPLOT_LOCK = threading.Lock()
+
 
 class FiniteStateReporter:
     """Enhanced Finite State API client with professional PDF generation."""
@@ -594,7 +598,19 @@ class FiniteStateReporter:
         width: float = 4 * inch,
         height: float = 3 * inch,
     ) -> Image:
-        """Create professional charts with brand colors."""
+        """Create professional charts with brand colors (thread-safe)."""
+        with _PYPLOT_LOCK:
+            return self._create_enhanced_chart(data, chart_type, title, width, height)
+
+    def _create_enhanced_chart(
+        self,
+        data: dict,
+        chart_type: str,
+        title: str,
+        width: float,
+        height: float,
+    ) -> Image:
+        """Render a chart with pyplot; callers must hold _PYPLOT_LOCK."""
         self.logger.info(f"Creating {chart_type} chart '{title}' with data: {data}")
 
         # Set backend explicitly
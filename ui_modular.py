@@ -5,15 +5,154 @@ UI 佈局比例修正版 (PanedWindow + 動態調整)
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext
 import threading
+import bisect
+import collections
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import os
-import subprocess
 import sys
-from datetime import datetime
+import time
 import json
+import re
+import logging
 import platform
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    _REQUESTS_IMPORT_ERROR = None
+except ImportError as e:
+    # 缺少 requests 時 UI 仍可啟動，API 操作會回報此錯誤
+    requests = None
+    _REQUESTS_IMPORT_ERROR = e
+
+try:
+    # 選用：有安裝 orjson 時以其序列化配置，否則使用標準 json
+    import orjson
+except ImportError:
+    orjson = None
+
+# fs-reporter 原始碼路徑，啟動時加入 Python 路徑一次
+FS_REPORTER_PATH = os.path.join(os.getcwd(), "fs-reporter", "src")
+if FS_REPORTER_PATH not in sys.path:
+    sys.path.insert(0, FS_REPORTER_PATH)
+
+# 深色主題樣式表 - setup_style 會逐項套用
+DARK_STYLES = {
+    'Dark.TFrame': {'background': '#2b2b2b'},
+    'Dark.TLabel': {'background': '#2b2b2b', 'foreground': 'white'},
+    'Dark.TLabelframe': {'background': '#2b2b2b', 'foreground': 'white', 'borderwidth': 1, 'relief': 'solid'},
+    'Dark.TLabelframe.Label': {'background': '#2b2b2b', 'foreground': 'white'},
+    'Dark.TEntry': {'fieldbackground': '#404040', 'foreground': 'white', 'borderwidth': 1},
+    'Dark.TButton': {'background': '#404040', 'foreground': 'white'},
+    'Generate.TButton': {'background': '#0078d4', 'foreground': 'white', 'font': ('Arial', 10, 'bold')},
+    'Dark.Treeview': {'background': '#404040', 'foreground': 'white', 'fieldbackground': '#404040'},
+    'Dark.Treeview.Heading': {'background': '#505050', 'foreground': 'white'},
+    'Dark.Horizontal.TProgressbar': {'background': '#0078d4', 'troughcolor': '#404040'},
+}
+
+# 專案樹狀檢視的節點圖示與版本列標籤
+PROJECT_ICON = "📁 "
+VERSION_ICON = "📄 "
+VERSION_TAGS = ("version",)
+
+# 版本總數超過此值時專案節點改為延遲載入，展開時才插入版本列
+LAZY_TREE_THRESHOLD = 500
+LAZY_STUB_PREFIX = "__stub__"
+
+# 將指定標籤的所有項目某一欄設為同一值的 Tcl 程序名稱
+TREE_SET_BY_TAG_PROC = "tmflow_tree_set_by_tag"
+
+# API 設定欄位的輸入框寬度與 grid 參數
+FIELD_WIDTH = 25
+FIELD_LABEL_GRID = {'sticky': tk.W, 'pady': 1}
+FIELD_ENTRY_GRID = {'sticky': tk.W, 'padx': (5, 0), 'pady': 1}
+
+# 報告類型對應的檔名後綴
+REPORT_SUFFIXES = {"standard": "Standard", "detailed": "Detailed"}
+
+# 同時查詢專案版本列表的最大請求數（需不超過 HTTP_POOL_SIZE）
+FETCH_CONCURRENCY = 8
+
+# 變更選擇等操作後延遲寫入配置的毫秒數
+SAVE_CONFIG_DELAY_MS = 500
+
+# 同時生成報告的最大執行緒數（需不超過 HTTP_POOL_SIZE）
+REPORT_MAX_WORKERS = 8
+
+# HTTP 連線池大小（涵蓋並行查詢版本與並行生成報告時的同時連線數）
+HTTP_POOL_SIZE = 20
+
+# 版本 ID 驗證結果的快取秒數與最多保留筆數
+VALIDATION_CACHE_TTL = 300
+VALIDATION_CACHE_MAX_SIZE = 256
+
+# 報告檔名格式
+REPORT_FILENAME_TEMPLATE = "TMflow_{version}_{suffix}_{timestamp}.pdf"
+REPORT_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# 日誌區最多保留的行數，超過時自動刪除最舊的內容
+LOG_MAX_LINES = 5000
+
+# API 回應狀態碼 -> (是否成功, 訊息)，連接測試與獲取專案共用
+_STATUS_MESSAGES = {
+    200: (True, "連接成功"),
+    401: (False, "API Token 無效或已過期"),
+    403: (False, "權限不足，請檢查 API Token 權限"),
+    404: (False, "API 端點不存在，請檢查 Subdomain"),
+}
+
+# 舊版 KEY=VALUE 配置中以 JSON 儲存與以 true/false 儲存的欄位
+_JSON_KEYS = frozenset({"SELECTED_VERSIONS", "PROJECTS_DATA"})
+_BOOL_KEYS = frozenset({"STANDARD_REPORT", "DETAILED_REPORT"})
+
+# 已安裝樣式的 Tk 直譯器，避免重複建立 UI 時再次設定樣式
+_STYLE_INSTALLED_FOR = None
+
+def _require_requests():
+    """確認 requests 模組可用，否則拋出導入時的錯誤"""
+    if _REQUESTS_IMPORT_ERROR is not None:
+        raise ImportError(f"無法導入 requests 模組: {_REQUESTS_IMPORT_ERROR}")
+
+# 日誌時間戳記快取：(整數秒, 格式化字串)，同一秒內的日誌共用
+_log_ts_cache = (None, "")
+
+def _log_timestamp():
+    """回傳 HH:MM:SS 格式的目前時間，同一秒內只格式化一次（可從任意執行緒呼叫）"""
+    global _log_ts_cache
+    now = int(time.time())
+    cached_sec, cached_str = _log_ts_cache
+    if now != cached_sec:
+        cached_str = time.strftime("%H:%M:%S", time.localtime(now))
+        _log_ts_cache = (now, cached_str)
+    return cached_str
+
+def _gil_status():
+    """回傳目前直譯器的 GIL 狀態說明（Python 3.13 自由執行緒版本可停用 GIL）"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None or is_gil_enabled():
+        return "GIL 啟用"
+    return "GIL 停用，背景執行緒可真正並行"
+
+def _version_sort_key(version_name, _split=re.compile(r"[._]").split):
+    """版本排序鍵：純數字版本（如 1.2_3）依數值比較，其餘依字串比較並排在後面"""
+    try:
+        return (1, tuple(int(part) for part in _split(version_name)))
+    except (ValueError, TypeError):
+        return (0, version_name)
+
+def _create_session(headers):
+    """建立帶連線池與重試機制的 HTTP Session"""
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    return session
+
 class APIManager:
     """API 管理模組 - 負責所有 API 相關操作"""
     
@@ -25,13 +164,27 @@ class APIManager:
             "X-Authorization": api_token,
             "Content-Type": "application/json"
         }
+        self._session = None
     
     def update_credentials(self, api_token, subdomain):
-        """更新 API 憑證"""
+        """更新 API 憑證（未變更時不做任何事）"""
+        if (api_token, subdomain) == (self.api_token, self.subdomain):
+            return
+        
         self.api_token = api_token
         self.subdomain = subdomain
         self.base_url = f"https://{subdomain}.finitestate.io/api"
         self.headers["X-Authorization"] = api_token
+        if self._session is not None:
+            self._session.headers["X-Authorization"] = api_token
+    
+    def _get_session(self):
+        """取得共用的 HTTP Session，重複請求時沿用既有的 TCP/TLS 連線"""
+        if self._session is None:
+            _require_requests()
+            
+            self._session = _create_session(self.headers)
+        return self._session
     
     def test_connection(self):
         """測試 API 連接"""
@@ -42,36 +195,36 @@ class APIManager:
             return False, "Subdomain 不能為空"
         
         try:
-            import requests
+            session = self._get_session()
             
-            response = requests.get(f"{self.base_url}/public/v0/projects", 
-                                  headers=self.headers, timeout=10)
+            response = session.get(f"{self.base_url}/public/v0/projects", timeout=10)
             
-            if response.status_code == 200:
-                return True, "連接成功"
-            elif response.status_code == 401:
-                return False, "API Token 無效或已過期"
-            elif response.status_code == 403:
-                return False, "權限不足，請檢查 API Token 權限"
-            elif response.status_code == 404:
-                return False, "API 端點不存在，請檢查 Subdomain"
-            else:
-                return False, f"API 回應錯誤: {response.status_code}"
+            return _STATUS_MESSAGES.get(
+                response.status_code, (False, f"API 回應錯誤: {response.status_code}")
+            )
                 
         except Exception as e:
             return False, f"連接測試失敗: {e}"
     
-    def fetch_projects(self):
-        """獲取專案列表"""
+    def fetch_projects(self, on_project=None):
+        """獲取專案列表
+        
+        on_project(position, project_name, versions) 會在每個專案的版本取得後依完成順序呼叫，
+        position 為該專案在 API 回應中的順序，呼叫端可藉此逐步顯示結果；
+        回呼在呼叫 fetch_projects 的執行緒中執行。回傳的專案仍依 API 順序排列。
+        """
         try:
-            import requests
+            session = self._get_session()
             
             # 獲取專案列表
-            projects_response = requests.get(f"{self.base_url}/public/v0/projects", 
-                                           headers=self.headers, timeout=30)
+            projects_response = session.get(f"{self.base_url}/public/v0/projects", timeout=30)
             
             if projects_response.status_code != 200:
-                return None, f"API 請求失敗: {projects_response.status_code}"
+                _, message = _STATUS_MESSAGES.get(
+                    projects_response.status_code,
+                    (False, f"API 請求失敗: {projects_response.status_code}")
+                )
+                return None, message
             
             projects_data = projects_response.json()
             
@@ -83,63 +236,25 @@ class APIManager:
             
             projects = {}
             
-            # 處理每個專案
-            for project in projects_list:
-                project_name = project.get('name', 'Unknown')
-                project_id = project.get('id')
-                
-                if not project_id:
-                    continue
-                
-                # 獲取專案的版本列表
-                versions_response = requests.get(
-                    f"{self.base_url}/public/v0/projects/{project_id}/versions",
-                    headers=self.headers,
-                    params={"limit": 50, "sort": "-created"},
-                    timeout=30
-                )
+            # 有 ID 的專案才能查詢版本
+            project_refs = [(project.get('name', 'Unknown'), project.get('id'))
+                            for project in projects_list if project.get('id')]
+            
+            # 並行獲取各專案的版本列表（共用 session 的連線池），結果依原專案順序合併
+            if project_refs:
+                max_workers = min(FETCH_CONCURRENCY, len(project_refs))
+                results = [None] * len(project_refs)
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch") as pool:
+                    futures = {pool.submit(self._fetch_project_versions, session, project_id): position
+                               for position, (_, project_id) in enumerate(project_refs)}
+                    # 先完成的專案先回報，不必等待排在前面的慢速專案
+                    for future in as_completed(futures):
+                        position = futures[future]
+                        versions = results[position] = future.result()
+                        if versions and on_project is not None:
+                            on_project(position, project_refs[position][0], versions)
                 
-                if versions_response.status_code == 200:
-                    versions_data = versions_response.json()
-                    
-                    # 處理版本回應格式
-                    if isinstance(versions_data, list):
-                        versions_list = versions_data
-                    else:
-                        versions_list = versions_data.get("items", [])
-                    
-                    versions = []
-                    
-                    for version in versions_list:
-                        version_name = version.get('version', version.get('name', 'Unknown'))
-                        version_id = str(version.get('id', ''))
-                        created_at = version.get('created', version.get('created_at', ''))
-                        
-                        if version_id:
-                            versions.append({
-                                "version": version_name,
-                                "project_id": str(project_id),
-                                "version_id": version_id,
-                                "created": created_at
-                            })
-                    
-                    # 按版本號降序排列
-                    def version_sort_key(v):
-                        version_name = v["version"]
-                        try:
-                            parts = version_name.replace('_', '.').split('.')
-                            numeric_parts = []
-                            for part in parts:
-                                try:
-                                    numeric_parts.append(int(part))
-                                except ValueError:
-                                    return (0, version_name)
-                            return (1, tuple(numeric_parts))
-                        except:
-                            return (0, version_name)
-                    
-                    versions.sort(key=version_sort_key, reverse=True)
-                    
+                for (project_name, _), versions in zip(project_refs, results):
                     if versions:
                         projects[project_name] = versions
             
@@ -148,26 +263,90 @@ class APIManager:
         except Exception as e:
             return None, f"獲取專案資料時發生錯誤: {e}"
 
+    def _fetch_project_versions(self, session, project_id):
+        """獲取單一專案的版本列表（按版本號降序），請求失敗時回傳空列表"""
+        versions_response = session.get(
+            f"{self.base_url}/public/v0/projects/{project_id}/versions",
+            params={"limit": 50, "sort": "-created"},
+            timeout=30
+        )
+        
+        if versions_response.status_code != 200:
+            return []
+        
+        versions_data = versions_response.json()
+        
+        # 處理版本回應格式
+        if isinstance(versions_data, list):
+            versions_list = versions_data
+        else:
+            versions_list = versions_data.get("items", [])
+        
+        versions = []
+        
+        for version in versions_list:
+            version_name = version.get('version', version.get('name', 'Unknown'))
+            version_id = str(version.get('id', ''))
+            created_at = version.get('created', version.get('created_at', ''))
+            
+            if version_id:
+                versions.append({
+                    "version": version_name,
+                    "project_id": str(project_id),
+                    "version_id": version_id,
+                    "created": created_at
+                })
+        
+        # 按版本號降序排列（key 每個版本只計算一次）
+        versions.sort(key=lambda v: _version_sort_key(v["version"]), reverse=True)
+        return versions
+
 class ReportGenerator:
     """報告生成模組 - 負責所有報告生成操作"""
     
-    def __init__(self, api_token="", subdomain="tm-robot", organization="Techman Robot"):
+    # fs-reporter 的 main 函數，所有實例共用（只在第一次需要時導入）
+    _reporter_main = None
+    
+    def __init__(self, api_token="", subdomain="tm-robot", organization="Techman Robot", verbose=False):
         self.api_token = api_token
         self.subdomain = subdomain
         self.organization = organization
+        self._session = None
+        # 版本 ID -> (驗證時間, 是否有效)，同一版本重複生成時省去驗證請求；
+        # 依最近使用順序排列，超過 VALIDATION_CACHE_MAX_SIZE 時移除最久未用的項目
+        self._validation_cache = collections.OrderedDict()
+        # 版本 ID -> 驗證中的 Future，同一版本的標準與詳細報告共用一次驗證請求
+        self._validation_inflight = {}
+        self._validation_lock = threading.Lock()
+        
+        # fs-reporter 的 INFO 日誌（含圖表資料傾印）沒有人讀取，預設只保留警告以上
+        logging.getLogger("finite_state_reporter").setLevel(
+            logging.INFO if verbose else logging.WARNING
+        )
     
     def update_config(self, api_token, subdomain, organization):
-        """更新配置"""
+        """更新配置（未變更時保留驗證快取）"""
+        if (api_token, subdomain, organization) == (self.api_token, self.subdomain, self.organization):
+            return
+        
         self.api_token = api_token
         self.subdomain = subdomain
         self.organization = organization
+        if self._session is not None:
+            self._session.headers["X-Authorization"] = api_token
+        self._validation_cache.clear()
     
-    def generate_single_report(self, version, version_id, report_type, output_dir):
-        """生成單個報告 - 激進重構：完全直接整合架構"""
+    def generate_single_report(self, version, version_id, report_type, output_dir, timestamp=None):
+        """生成單個報告 - 激進重構：完全直接整合架構
+        
+        timestamp 由批次生成時統一傳入；未提供時使用目前時間。
+        """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_suffix = "Standard" if report_type == "standard" else "Detailed"
-            filename = f"TMflow_{version}_{report_suffix}_{timestamp}.pdf"
+            if timestamp is None:
+                timestamp = time.strftime(REPORT_TIMESTAMP_FORMAT)
+            filename = REPORT_FILENAME_TEMPLATE.format(
+                version=version, suffix=REPORT_SUFFIXES[report_type], timestamp=timestamp
+            )
             output_path = os.path.join(output_dir, filename)
             
             # 激進方案：完全直接整合 fs-reporter 核心功能
@@ -179,25 +358,17 @@ class ReportGenerator:
     def _direct_integration_only(self, version_id, report_type, output_path):
         """激進重構：只使用直接整合，徹底解決彈出視窗問題"""
         try:
-            # 1. 動態添加 fs-reporter 到 Python 路徑
-            import sys
-            import os
-            
-            fs_reporter_path = os.path.join(os.getcwd(), "fs-reporter", "src")
-            if fs_reporter_path not in sys.path:
-                sys.path.insert(0, fs_reporter_path)
-            
-            # 2. 先驗證版本 ID 是否有效
+            # 1. 先驗證版本 ID 是否有效
             if not self._validate_version_id(version_id):
                 return False, f"版本 ID {version_id} 無效或已過期"
             
-            # 3. 直接導入和調用 fs-reporter 核心功能
-            from finite_state_reporter.core.reporter import main
+            # 2. 取得 fs-reporter 核心功能（只在第一次呼叫時導入）
+            main = self._load_reporter_main()
             
-            # 4. 設定參數
+            # 3. 設定參數
             detailed_findings = (report_type == "detailed")
             
-            # 5. 直接調用 main 函數，完全避免 subprocess
+            # 4. 直接調用 main 函數，完全避免 subprocess
             main(
                 token=self.api_token,
                 subdomain=self.subdomain,
@@ -209,7 +380,7 @@ class ReportGenerator:
                 organization_name=self.organization
             )
             
-            # 6. 檢查檔案是否成功生成
+            # 5. 檢查檔案是否成功生成
             if os.path.exists(output_path):
                 file_size = os.path.getsize(output_path)
                 return True, f"{output_path} ({file_size} bytes)"
@@ -221,19 +392,82 @@ class ReportGenerator:
         except Exception as e:
             return False, f"直接整合執行失敗: {e}"
     
+    def _load_reporter_main(self):
+        """導入 fs-reporter 核心入口並快取，後續報告直接呼叫"""
+        if ReportGenerator._reporter_main is None:
+            from finite_state_reporter.core.reporter import main
+            ReportGenerator._reporter_main = main
+        return ReportGenerator._reporter_main
+    
+    def preload_reporter(self):
+        """預先導入 fs-reporter（matplotlib / reportlab），縮短第一份報告的等待時間"""
+        try:
+            self._load_reporter_main()
+            return True, "成功"
+        except Exception as e:
+            # 預先載入失敗不影響 UI，實際生成時會再回報錯誤
+            return False, f"預先載入 fs-reporter 失敗: {e}"
+    
+    def _get_session(self):
+        """取得驗證版本用的共用 HTTP Session，批次生成時沿用既有連線"""
+        if self._session is None:
+            _require_requests()
+            self._session = _create_session({"X-Authorization": self.api_token})
+        return self._session
+    
     def _validate_version_id(self, version_id):
-        """驗證版本 ID 是否有效"""
+        """驗證版本 ID 是否有效（確定的結果快取 VALIDATION_CACHE_TTL 秒）"""
+        with self._validation_lock:
+            cached = self._validation_cache.get(version_id)
+            if cached is not None:
+                if time.monotonic() - cached[0] < VALIDATION_CACHE_TTL:
+                    self._validation_cache.move_to_end(version_id)
+                    return cached[1]
+                del self._validation_cache[version_id]  # 已過期
+            
+            future = self._validation_inflight.get(version_id)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._validation_inflight[version_id] = future
+        
+        # 其他執行緒正在驗證同一版本時等待其結果
+        if not owner:
+            return future.result()
+        
+        is_valid = True
+        try:
+            is_valid = self._request_version_validity(version_id)
+            return is_valid
+        finally:
+            with self._validation_lock:
+                del self._validation_inflight[version_id]
+            future.set_result(is_valid)
+    
+    def _request_version_validity(self, version_id):
+        """向 API 查詢版本 ID 是否有效，只快取 200（有效）與 404（無效）"""
         try:
-            import requests
+            session = self._get_session()
             
-            # 使用 API 驗證版本 ID
-            response = requests.get(
-                f"https://{self.subdomain}.finitestate.io/api/public/v0/versions/{version_id}",
-                headers={"X-Authorization": self.api_token},
-                timeout=10
-            )
+            # 使用 API 驗證版本 ID：只需狀態碼，先以 HEAD 請求避免下載版本內容
+            url = f"https://{self.subdomain}.finitestate.io/api/public/v0/versions/{version_id}"
+            response = session.head(url, timeout=10, allow_redirects=True)
+            status_code = response.status_code
+            
+            if status_code in (405, 501):
+                # API 不支援 HEAD 時改用串流 GET，讀到標頭後即關閉連線
+                with session.get(url, stream=True, timeout=10, allow_redirects=True) as response:
+                    status_code = response.status_code
             
-            return response.status_code == 200
+            is_valid = status_code == 200
+            if status_code in (200, 404):
+                # 其他狀態碼（認證失敗、伺服器錯誤等）可能是暫時的，不快取
+                with self._validation_lock:
+                    self._validation_cache[version_id] = (time.monotonic(), is_valid)
+                    self._validation_cache.move_to_end(version_id)
+                    if len(self._validation_cache) > VALIDATION_CACHE_MAX_SIZE:
+                        self._validation_cache.popitem(last=False)
+            return is_valid
             
         except Exception as e:
             # 如果驗證失敗，記錄錯誤但不阻止執行
@@ -245,6 +479,8 @@ class ConfigManager:
     
     def __init__(self, config_file="config.txt"):
         self.config_file = config_file
+        # 最近一次載入是否已將舊版配置轉存為 JSON（由 UI 寫入日誌）
+        self.migrated_legacy = False
     
     def load_config(self):
         """載入配置檔案"""
@@ -262,45 +498,80 @@ class ConfigManager:
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            if "=" in line:
-                                key, value = line.split("=", 1)
-                                key = key.strip()
-                                value = value.strip()
-                                
-                                if key in ["SELECTED_VERSIONS", "PROJECTS_DATA"]:
-                                    try:
-                                        config[key] = json.loads(value)
-                                    except:
-                                        config[key] = [] if key == "SELECTED_VERSIONS" else {}
-                                elif key in ["STANDARD_REPORT", "DETAILED_REPORT"]:
-                                    config[key] = value.lower() == 'true'
-                                else:
-                                    config[key] = value
+                    content = f.read()
+                
+                if content.lstrip().startswith("{"):
+                    # 新格式：整個檔案為單一 JSON 文件
+                    config.update(json.loads(content))
+                else:
+                    # 舊格式：KEY=VALUE 逐行設定（相容 config.example.txt），
+                    # 解析後立即轉存為 JSON，之後的啟動只需一次 json.loads；
+                    # 空白或只有註解的檔案不轉存，避免把預設值（含 API Token）寫入磁碟
+                    if self._parse_legacy_config(content, config):
+                        self.migrated_legacy = self.save_config(config)
         except Exception as e:
             print(f"載入配置檔案失敗: {e}")
         
         return config
     
+    def _parse_legacy_config(self, content, config):
+        """解析舊版 KEY=VALUE 格式的配置內容，回傳解析到的設定行數"""
+        parsed = 0
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            
+            key, sep, value = line.partition("=")
+            if not sep:
+                continue
+            key = key.rstrip()
+            value = value.lstrip()
+            parsed += 1
+            
+            if key in _JSON_KEYS:
+                try:
+                    config[key] = json.loads(value)
+                except json.JSONDecodeError:
+                    config[key] = [] if key == "SELECTED_VERSIONS" else {}
+            elif key in _BOOL_KEYS:
+                config[key] = value.lower() == 'true'
+            else:
+                config[key] = value
+        
+        return parsed
+    
     def save_config(self, config):
-        """儲存配置檔案"""
+        """儲存配置檔案 - 以 JSON 寫入暫存檔後原子性取代"""
+        temp_file = self.config_file + ".tmp"
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                f.write("# TMflow Security Report Generator 配置檔案\n")
-                f.write("# 請勿將此檔案提交到 Git\n\n")
-                
-                for key, value in config.items():
-                    if key in ["SELECTED_VERSIONS", "PROJECTS_DATA"]:
-                        f.write(f"{key}={json.dumps(value, ensure_ascii=False)}\n")
-                    else:
-                        f.write(f"{key}={value}\n")
+            # 先在記憶體中序列化為 UTF-8，再一次寫入（json.dump 會分成許多小片段寫入）
+            if orjson is not None:
+                content = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                content = json.dumps(config, ensure_ascii=False, indent=2).encode("utf-8")
+            with open(temp_file, "wb") as f:
+                f.write(content)
+            os.replace(temp_file, self.config_file)
             return True
         except Exception as e:
             print(f"儲存配置檔案失敗: {e}")
             return False
 
+class ReporterLogHandler(logging.Handler):
+    """日誌轉送模組 - 將 fs-reporter 的日誌即時轉送到 UI 日誌區"""
+    
+    def __init__(self, log_callback, level=logging.WARNING):
+        super().__init__(level)
+        # log_callback 必須可從任意執行緒呼叫（例如 UI 的 _post_log）
+        self.log_callback = log_callback
+    
+    def emit(self, record):
+        try:
+            self.log_callback(f"⚠️ fs-reporter: {record.getMessage()}")
+        except Exception:
+            self.handleError(record)
+
 class ModularTMflowReportGeneratorUI:
     """主 UI 類別 - 使用模組化架構"""
     
@@ -331,6 +602,7 @@ class ModularTMflowReportGeneratorUI:
         self.setup_style()
         self.setup_variables()
         self.create_widgets()
+        self.setup_reporter_logging()
         self.load_initial_data()
         
         # 綁定關閉事件
@@ -339,16 +611,15 @@ class ModularTMflowReportGeneratorUI:
     def auto_connect_api(self):
         """自動連線 API"""
         if self.api_token.get() and self.subdomain.get():
-            # 延遲 500ms 後自動連線，讓 UI 先完成初始化
-            self.root.after(500, self._auto_test_connection)
+            # 等 UI 完成初始化與首次繪製（事件迴圈閒置）後立即連線，不再固定等待 500ms
+            self.root.after_idle(self._auto_test_connection)
     
     def _auto_test_connection(self):
         """自動測試連接（不彈出錯誤對話框）"""
         self.log_message("正在測試 API 連接...")
         
         # 更新狀態為測試中
-        self.status_canvas.delete("all")
-        self.status_canvas.create_oval(2, 2, 10, 10, fill='#ffff00', outline='')
+        self.status_canvas.itemconfigure(self._status_dot, fill='#ffff00')
         
         # 更新 API 管理器的憑證
         self.api_manager.update_credentials(
@@ -367,21 +638,22 @@ class ModularTMflowReportGeneratorUI:
         self.root.configure(bg='#2b2b2b')
     
     def setup_style(self):
-        """設定深色主題樣式"""
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
+        """設定深色主題樣式（每個 Tk 直譯器只安裝一次）"""
+        global _STYLE_INSTALLED_FOR
+        self.style = ttk.Style(self.root)
+        
+        if _STYLE_INSTALLED_FOR is self.root.tk:
+            return
         
-        # 深色主題配色
-        self.style.configure('Dark.TFrame', background='#2b2b2b')
-        self.style.configure('Dark.TLabel', background='#2b2b2b', foreground='white')
-        self.style.configure('Dark.TLabelframe', background='#2b2b2b', foreground='white', borderwidth=1, relief='solid')
-        self.style.configure('Dark.TLabelframe.Label', background='#2b2b2b', foreground='white')
-        self.style.configure('Dark.TEntry', fieldbackground='#404040', foreground='white', borderwidth=1)
-        self.style.configure('Dark.TButton', background='#404040', foreground='white')
-        self.style.configure('Generate.TButton', background='#0078d4', foreground='white', font=('Arial', 10, 'bold'))
-        self.style.configure('Dark.Treeview', background='#404040', foreground='white', fieldbackground='#404040')
-        self.style.configure('Dark.Treeview.Heading', background='#505050', foreground='white')
-        self.style.configure('Dark.Horizontal.TProgressbar', background='#0078d4', troughcolor='#404040')
+        self.style.theme_use('clam')
+        for style_name, options in DARK_STYLES.items():
+            self.style.configure(style_name, **options)
+        _STYLE_INSTALLED_FOR = self.root.tk
+    
+    def setup_reporter_logging(self):
+        """將 fs-reporter 的警告與錯誤即時顯示在日誌區"""
+        self._reporter_log_handler = ReporterLogHandler(self._post_log)
+        logging.getLogger("finite_state_reporter").addHandler(self._reporter_log_handler)
     
     def setup_variables(self):
         """設定變數"""
@@ -395,10 +667,34 @@ class ModularTMflowReportGeneratorUI:
         # 專案資料
         self.projects_data = {}
         self.selected_versions = set()
+        self._version_index = {}
+        self._lazy_versions = {}
+        # 獲取中已逐步插入樹狀檢視的專案 -> 版本列表
+        self._streamed_projects = {}
+        # 已插入專案在 API 回應中的順序（已排序），用來決定新專案的插入位置
+        self._streamed_positions = []
+        self._streamed_version_count = 0
+        # 是否有專案以展開狀態插入（版本總數超過門檻時需改為延遲載入）
+        self._streamed_expanded = False
         
         # 狀態變數
         self.is_generating = False
-        self.generation_cancelled = False
+        self._cancel_evt = threading.Event()  # 由 Cancel 按鈕設定、報告執行緒檢查的取消旗標
+        self._report_pool = None
+        
+        # 背景執行緒送出的日誌與進度，合併後由 Tk 主執行緒一次刷新
+        self._log_queue = collections.deque()
+        self._pending_progress = None
+        self._ui_flush_pending = False
+        
+        # 延遲寫入配置的排程 ID，連續操作只在最後一次後寫入一次
+        self._save_after_id = None
+        
+        # 配置由背景執行緒寫檔，UI 不必等待序列化與磁碟 I/O
+        self._cfg_pending = None
+        self._cfg_event = threading.Event()
+        self._cfg_write_lock = threading.Lock()
+        self._cfg_writer = None
     
     def create_widgets(self):
         """建立所有 UI 元件"""
@@ -427,6 +723,8 @@ class ModularTMflowReportGeneratorUI:
         
         # 綁定視窗大小變化事件，動態調整分隔位置
         self.resize_timer = None
+        self._last_w = 0
+        self._last_sash = -1
         self.root.bind('<Configure>', self.on_window_resize)
         
         # 建立各區域
@@ -446,8 +744,9 @@ class ModularTMflowReportGeneratorUI:
         toolbar = ttk.Frame(projects_group, style='Dark.TFrame')
         toolbar.pack(fill=tk.X, pady=(0, 5))
         
-        ttk.Button(toolbar, text="🔄 Refresh", style='Dark.TButton', 
-                  command=self.refresh_projects).pack(side=tk.LEFT, padx=(0, 5))
+        self.refresh_btn = ttk.Button(toolbar, text="🔄 Refresh", style='Dark.TButton', 
+                                      command=self.refresh_projects)
+        self.refresh_btn.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(toolbar, text="Select All", style='Dark.TButton', 
                   command=self.select_all_versions).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(toolbar, text="Clear All", style='Dark.TButton', 
@@ -484,8 +783,15 @@ class ModularTMflowReportGeneratorUI:
         self.projects_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # 綁定點擊事件
+        # 註冊批次更新欄位用的 Tcl 程序
+        self.root.tk.eval(
+            f"proc {TREE_SET_BY_TAG_PROC} {{w tag col val}} "
+            "{foreach id [$w tag has $tag] {$w set $id $col $val}}"
+        )
+        
+        # 綁定點擊與展開事件
         self.projects_tree.bind("<Button-1>", self.on_tree_click)
+        self.projects_tree.bind("<<TreeviewOpen>>", self._on_project_open)
     
     def create_report_options_section(self, parent):
         """建立報告選項區域"""
@@ -503,11 +809,13 @@ class ModularTMflowReportGeneratorUI:
         
         self.standard_check = tk.Checkbutton(report_frame, text="Standard Report", 
                                            variable=self.standard_report,
+                                           command=self._clear_status_msg,
                                            bg='#2b2b2b', fg='white', selectcolor='#404040')
         self.standard_check.pack(side=tk.LEFT, padx=(0, 20))
         
         self.detailed_check = tk.Checkbutton(report_frame, text="Detailed Report", 
                                            variable=self.detailed_report,
+                                           command=self._clear_status_msg,
                                            bg='#2b2b2b', fg='white', selectcolor='#404040')
         self.detailed_check.pack(side=tk.LEFT)
         
@@ -517,6 +825,11 @@ class ModularTMflowReportGeneratorUI:
                                      command=self.generate_reports)
         self.generate_btn.pack(side=tk.RIGHT)
         
+        # 生成前檢查的提示訊息（取代會中斷操作的警告對話框）
+        self.status_msg = tk.StringVar()
+        ttk.Label(top_frame, textvariable=self.status_msg, style='Dark.TLabel',
+                  foreground='#ff6b6b').pack(side=tk.RIGHT, padx=(0, 10))
+        
         # 第二行：輸出路徑
         output_frame = ttk.Frame(options_group, style='Dark.TFrame')
         output_frame.pack(fill=tk.X)
@@ -561,7 +874,7 @@ class ModularTMflowReportGeneratorUI:
         self.status_canvas = tk.Canvas(status_frame, width=12, height=12, 
                                      bg='#2b2b2b', highlightthickness=0)
         self.status_canvas.pack(side=tk.LEFT, padx=(0, 5))
-        self.status_canvas.create_oval(2, 2, 10, 10, fill='#ff0000', outline='')
+        self._status_dot = self.status_canvas.create_oval(2, 2, 10, 10, fill='#ff0000', outline='')
         
         self.status_label = ttk.Label(status_frame, text="Disconnected", style='Dark.TLabel')
         self.status_label.pack(side=tk.LEFT, padx=(0, 20))
@@ -574,28 +887,19 @@ class ModularTMflowReportGeneratorUI:
         api_config_frame = ttk.Frame(api_group, style='Dark.TFrame')
         api_config_frame.pack(fill=tk.X)
         
-        field_width = 25
-        
-        # API Token
-        token_frame = ttk.Frame(api_config_frame, style='Dark.TFrame')
-        token_frame.pack(fill=tk.X, pady=1)
-        ttk.Label(token_frame, text="API Token:", style='Dark.TLabel', width=10).pack(side=tk.LEFT)
-        ttk.Entry(token_frame, textvariable=self.api_token, show="*", 
-                 width=field_width, style='Dark.TEntry').pack(side=tk.LEFT, padx=(5, 0))
-        
-        # Subdomain
-        subdomain_frame = ttk.Frame(api_config_frame, style='Dark.TFrame')
-        subdomain_frame.pack(fill=tk.X, pady=1)
-        ttk.Label(subdomain_frame, text="Subdomain:", style='Dark.TLabel', width=10).pack(side=tk.LEFT)
-        ttk.Entry(subdomain_frame, textvariable=self.subdomain, 
-                 width=field_width, style='Dark.TEntry').pack(side=tk.LEFT, padx=(5, 0))
-        
-        # Organization
-        org_frame = ttk.Frame(api_config_frame, style='Dark.TFrame')
-        org_frame.pack(fill=tk.X, pady=1)
-        ttk.Label(org_frame, text="Organization:", style='Dark.TLabel', width=10).pack(side=tk.LEFT)
-        ttk.Entry(org_frame, textvariable=self.organization, 
-                 width=field_width, style='Dark.TEntry').pack(side=tk.LEFT, padx=(5, 0))
+        # 各欄位直接以 grid 排列在同一框架中，不再為每一行建立額外的 Frame
+        self._create_labeled_entry(api_config_frame, 0, "API Token:", self.api_token, show="*")
+        self._create_labeled_entry(api_config_frame, 1, "Subdomain:", self.subdomain)
+        self._create_labeled_entry(api_config_frame, 2, "Organization:", self.organization)
+    
+    def _create_labeled_entry(self, parent, row, label, variable, **entry_options):
+        """在 parent 的指定行建立「標籤 + 輸入框」"""
+        ttk.Label(parent, text=label, style='Dark.TLabel', width=10).grid(
+            row=row, column=0, **FIELD_LABEL_GRID)
+        entry = ttk.Entry(parent, textvariable=variable, width=FIELD_WIDTH,
+                          style='Dark.TEntry', **entry_options)
+        entry.grid(row=row, column=1, **FIELD_ENTRY_GRID)
+        return entry
     
     def create_log_section(self, parent):
         """建立日誌區域"""
@@ -610,16 +914,21 @@ class ModularTMflowReportGeneratorUI:
                                                 bg='#404040', fg='white', 
                                                 insertbackground='white')
         self.log_text.pack(fill=tk.BOTH, expand=True)
+        self._log_line_count = 0
     
     def on_window_resize(self, event):
         """視窗大小變化時，動態調整 PanedWindow 分隔位置以維持 60:40 比例"""
-        # 只處理主視窗的 Configure 事件
-        if event.widget == self.root:
-            # 取消之前的計時器
-            if self.resize_timer:
-                self.root.after_cancel(self.resize_timer)
-            # 延遲 100ms 執行，避免在調整過程中頻繁觸發
-            self.resize_timer = self.root.after(100, self.adjust_paned_position)
+        # 只處理主視窗寬度實際改變的 Configure 事件（移動視窗、子元件事件都略過）
+        if event.widget is self.root and event.width != self._last_w:
+            self._last_w = event.width
+            # 已排程時不重設計時器，拖曳過程中最多每 100ms 調整一次
+            if not self.resize_timer:
+                self.resize_timer = self.root.after(100, self._do_resize)
+    
+    def _do_resize(self):
+        """執行排程中的分隔位置調整"""
+        self.resize_timer = None
+        self.adjust_paned_position()
     
     def adjust_paned_position(self):
         """調整 PanedWindow 分隔位置為 60:40"""
@@ -627,15 +936,21 @@ class ModularTMflowReportGeneratorUI:
             # 獲取 PanedWindow 的實際寬度
             paned_width = self.paned.winfo_width()
             if paned_width > 1:  # 確保已經渲染
-                # 計算 60% 的位置
+                # 計算 60% 的位置，與上次相同時不必再呼叫 sash_place
                 sash_position = int(paned_width * 0.6)
+                if sash_position == self._last_sash:
+                    return
+                self._last_sash = sash_position
                 self.paned.sash_place(0, sash_position, 0)
-        except:
-            pass  # 忽略任何錯誤
+        except tk.TclError:
+            pass  # 視窗尚未顯示或已關閉時忽略
     
     def load_initial_data(self):
         """載入初始資料 - v1.0.2.048 UI 佈局比例修正版"""
         self.log_message("TMflow Security Report Generator v1.0.2.048")
+        self.log_message(f"Python {platform.python_version()}（{_gil_status()}）")
+        if self.config_manager.migrated_legacy:
+            self.log_message("已將舊版配置檔案轉換為 JSON 格式")
         
         # 優先載入保存的專案資料（保持原有邏輯）
         if self.config["PROJECTS_DATA"]:
@@ -646,6 +961,15 @@ class ModularTMflowReportGeneratorUI:
         
         # 自動連線 API
         self.auto_connect_api()
+        
+        # 在背景預先載入 fs-reporter，避免第一份報告承擔導入成本
+        threading.Thread(target=self._preload_reporter_thread, daemon=True).start()
+    
+    def _preload_reporter_thread(self):
+        """在背景執行緒中預先載入 fs-reporter，失敗時寫入日誌"""
+        success, message = self.report_generator.preload_reporter()
+        if not success:
+            self._post_log(f"⚠️ {message}")
     
     def load_known_projects_data(self):
         """載入已知專案資料 - v1.0.2.042 清空版本供分享使用"""
@@ -682,40 +1006,111 @@ class ModularTMflowReportGeneratorUI:
                 if version_id:
                     self.selected_versions.add(version_id)
             
-            # 填充樹狀檢視
-            self.populate_projects_tree()
+            # 填充樹狀檢視：排到閒置時執行，讓視窗先完成第一次繪製
+            self.root.after_idle(self._populate_saved_projects)
             
         except Exception as e:
-            self.log_message(f"載入專案資料失敗: {e}")
-            # 如果載入失敗，使用已知專案資料作為備用
-            self.log_message("使用已知專案資料作為備用")
-            self.load_known_projects_data()
+            self._load_projects_failed(e)
+    
+    def _populate_saved_projects(self):
+        """填充從配置載入的專案；資料有誤時與載入失敗相同改用備用資料"""
+        try:
+            self.populate_projects_tree()
+        except Exception as e:
+            self._load_projects_failed(e)
+    
+    def _load_projects_failed(self, error):
+        """記錄專案資料載入失敗，並改用已知專案資料"""
+        self.log_message(f"載入專案資料失敗: {error}")
+        # 如果載入失敗，使用已知專案資料作為備用
+        self.log_message("使用已知專案資料作為備用")
+        self.load_known_projects_data()
     
     def populate_projects_tree(self):
         """填充專案樹狀檢視"""
-        # 清空現有項目
-        for item in self.projects_tree.get_children():
-            self.projects_tree.delete(item)
+        self._clear_projects_tree()
         
         if not self.projects_data:
             return
         
+        # 版本數量很多時專案節點預設收合，展開時才插入該專案的版本列
+        lazy = sum(map(len, self.projects_data.values())) > LAZY_TREE_THRESHOLD
+        
+        # 同一個回呼內的插入不會觸發重繪，Tk 閒置時才一次排版
         for project_name, versions in self.projects_data.items():
-            project_node = self.projects_tree.insert("", "end", 
-                                                    text=f"📁 {project_name}", open=True)
-            
-            for version_data in versions:
-                is_selected = version_data['version_id'] in self.selected_versions
-                select_symbol = "☑" if is_selected else "☐"
-                
-                version_node = self.projects_tree.insert(
-                    project_node, "end", 
-                    text=f"📄 {project_name}",
-                    values=(select_symbol, version_data['version'], 
-                           version_data['project_id'][:12] + "...", 
-                           version_data['version_id'][:10] + "..."),
-                    tags=("version",)
-                )
+            self._insert_project_rows(project_name, versions, lazy)
+    
+    def _clear_projects_tree(self):
+        """清空樹狀檢視與版本查找表"""
+        # 清空現有項目（單次 Tcl 呼叫）
+        self.projects_tree.delete(*self.projects_tree.get_children())
+        
+        # 版本 ID（同時是版本列的樹狀檢視項目 ID）-> (專案名稱, 版本資料)，
+        # 點擊與儲存選擇時都直接查表，不需向 Tcl 查詢欄位值
+        self._version_index = {}
+        # 尚未展開的專案節點 -> (專案名稱, 待插入的版本列表)
+        self._lazy_versions = {}
+    
+    def _insert_project_rows(self, project_name, versions, lazy=False, index="end"):
+        """插入一個專案節點並登記其版本到版本查找表
+        
+        lazy 為 True 時節點預設收合，只放一個佔位子項目，展開時才插入版本列。
+        """
+        project_node = self.projects_tree.insert("", index, 
+                                                text=PROJECT_ICON + project_name, open=not lazy)
+        
+        unique_versions = []
+        for version_data in versions:
+            version_id = version_data['version_id']
+            if version_id in self._version_index:
+                continue  # 項目 ID 不可重複，重複的版本只顯示第一筆
+            self._version_index[version_id] = (project_name, version_data)
+            unique_versions.append(version_data)
+        
+        if lazy:
+            self._lazy_versions[project_node] = (project_name, unique_versions)
+            self.projects_tree.insert(project_node, "end", iid=LAZY_STUB_PREFIX + project_node)
+        else:
+            self._insert_version_rows(project_node, project_name, unique_versions)
+    
+    def _insert_version_rows(self, project_node, project_name, versions):
+        """在專案節點下插入版本列（項目 ID 即版本 ID）"""
+        version_text = VERSION_ICON + project_name
+        selected = self.selected_versions
+        # 同一專案的版本共用專案 ID，截短後的顯示字串只需計算一次
+        project_id_texts = {}
+        for version_data in versions:
+            project_id = version_data['project_id']
+            if project_id not in project_id_texts:
+                project_id_texts[project_id] = project_id[:12] + "..."
+        
+        # 先組好所有列的欄位值，插入迴圈只剩 Treeview 呼叫
+        rows = [
+            (version_data['version_id'],
+             ("☑" if version_data['version_id'] in selected else "☐",
+              version_data['version'],
+              project_id_texts[version_data['project_id']],
+              version_data['version_id'][:10] + "..."))
+            for version_data in versions
+        ]
+        
+        # 直接呼叫 Tcl 的 insert，省去 Treeview.insert 每列的選項格式化
+        tk_call = self.projects_tree.tk.call
+        tree_path = str(self.projects_tree)
+        for version_id, values in rows:
+            tk_call(tree_path, "insert", project_node, "end", "-id", version_id,
+                    "-text", version_text, "-values", values, "-tags", VERSION_TAGS)
+    
+    def _on_project_open(self, event):
+        """展開延遲載入的專案節點時，以實際版本列取代佔位項目"""
+        project_node = self.projects_tree.focus()
+        pending = self._lazy_versions.pop(project_node, None)
+        if pending is None:
+            return
+        
+        project_name, versions = pending
+        self.projects_tree.delete(LAZY_STUB_PREFIX + project_node)
+        self._insert_version_rows(project_node, project_name, versions)
     
     def on_tree_click(self, event):
         """處理樹狀檢視點擊事件"""
@@ -723,64 +1118,58 @@ class ModularTMflowReportGeneratorUI:
         column = self.projects_tree.identify("column", event.x, event.y)
         
         if item and column == "#1":  # Select 欄位
-            if "version" in self.projects_tree.item(item, "tags"):
-                version_info = self._find_version_by_tree_item(item)
-                if version_info:
-                    version_id = version_info['version_id']
-                    
-                    # 切換選擇狀態
-                    if version_id in self.selected_versions:
-                        self.selected_versions.remove(version_id)
-                        new_symbol = "☐"
-                    else:
-                        self.selected_versions.add(version_id)
-                        new_symbol = "☑"
-                    
-                    # 更新樹狀檢視顯示
-                    current_values = list(self.projects_tree.item(item, "values"))
-                    current_values[0] = new_symbol
-                    self.projects_tree.item(item, values=current_values)
-                    
-                    # 自動保存
-                    self.save_config()
-    
-    def _find_version_by_tree_item(self, tree_item):
-        """根據樹狀檢視項目找到對應的版本資料"""
-        try:
-            values = self.projects_tree.item(tree_item, "values")
-            if len(values) >= 4:
-                version_name = values[1]
-                version_id_short = values[3].replace('...', '')
+            # 版本列的項目 ID 即版本 ID；專案節點不在版本索引中
+            if item in self._version_index:
+                version_id = item
+                
+                # 切換選擇狀態
+                if version_id in self.selected_versions:
+                    self.selected_versions.remove(version_id)
+                    new_symbol = "☐"
+                else:
+                    self.selected_versions.add(version_id)
+                    new_symbol = "☑"
+                
+                # 更新樹狀檢視顯示（只改 Select 欄位）
+                self.projects_tree.set(item, "select", new_symbol)
+                self._clear_status_msg()
                 
-                for project_name, versions in self.projects_data.items():
-                    for version_data in versions:
-                        if (version_data['version'] == version_name and 
-                            version_data['version_id'].startswith(version_id_short)):
-                            return version_data
-        except:
-            pass
-        return None
+                # 自動保存
+                self.save_config()
+    
+    def _clear_status_msg(self):
+        """選擇變更後清除生成前檢查的提示訊息"""
+        self.status_msg.set("")
     
     def select_all_versions(self):
         """選擇所有版本"""
-        for project_name, versions in self.projects_data.items():
-            for version_data in versions:
-                self.selected_versions.add(version_data['version_id'])
+        # 版本索引的鍵即所有已顯示版本的 ID
+        self.selected_versions.update(self._version_index)
         
-        self.populate_projects_tree()
+        self._set_all_select_symbols("☑")
+        self._clear_status_msg()
         self.save_config()
         self.log_message(f"已選擇所有版本 ({len(self.selected_versions)} 個)")
     
     def clear_all_versions(self):
         """清除所有選擇"""
         self.selected_versions.clear()
-        self.populate_projects_tree()
+        self._set_all_select_symbols("☐")
+        self._clear_status_msg()
         self.save_config()
         self.log_message("已清除所有選擇")
     
+    def _set_all_select_symbols(self, symbol):
+        """直接更新所有版本列的 Select 欄位，不重建樹狀檢視"""
+        # 迴圈在 Tcl 中執行，整批更新只需一次 Python -> Tcl 呼叫
+        self.root.tk.call(TREE_SET_BY_TAG_PROC, str(self.projects_tree),
+                          VERSION_TAGS[0], "select", symbol)
+    
     def refresh_projects(self):
         """重新整理專案"""
         self.log_message("正在重新整理專案列表...")
+        # 獲取完成前不可再次重新整理，避免兩次獲取同時插入專案列
+        self.refresh_btn.configure(state='disabled')
         
         # 更新 API 管理器的憑證
         self.api_manager.update_credentials(
@@ -788,28 +1177,82 @@ class ModularTMflowReportGeneratorUI:
             self.subdomain.get()
         )
         
+        # 樹狀檢視為空時逐個專案顯示，不必等所有版本列表都回應
+        streamed = not self.projects_data
+        if streamed:
+            self._clear_projects_tree()
+            self._reset_streamed_projects()
+        
         # 在背景執行緒中獲取專案資料
-        threading.Thread(target=self._fetch_projects_thread, daemon=True).start()
+        threading.Thread(target=self._fetch_projects_thread, args=(streamed,), daemon=True).start()
     
-    def _fetch_projects_thread(self):
+    def _fetch_projects_thread(self, streamed=False):
         """在背景執行緒中獲取專案資料"""
+        projects, message = None, None
         try:
-            projects, message = self.api_manager.fetch_projects()
+            on_project = None
+            if streamed:
+                on_project = functools.partial(self.root.after, 0, self._insert_streamed_project)
+            
+            projects, message = self.api_manager.fetch_projects(on_project)
             
-            if projects:
-                self.root.after(0, lambda: self._update_projects_data(projects))
-            else:
-                self.root.after(0, lambda: self.log_message(f"❌ {message}"))
-                
         except Exception as e:
-            self.root.after(0, lambda: self.log_message(f"獲取專案資料時發生錯誤: {e}"))
+            message = f"獲取專案資料時發生錯誤: {e}"
+        finally:
+            self.root.after(0, self._fetch_projects_done, projects, message, streamed)
     
-    def _update_projects_data(self, projects):
-        """更新專案資料"""
-        self.projects_data = projects
-        self.populate_projects_tree()
+    def _reset_streamed_projects(self):
+        """清除逐步插入專案時的暫存狀態"""
+        self._streamed_projects = {}
+        self._streamed_positions = []
+        self._streamed_version_count = 0
+        self._streamed_expanded = False
+    
+    def _insert_streamed_project(self, position, project_name, versions):
+        """依 API 順序插入獲取過程中回報的專案（同名專案只插入一次）"""
+        if project_name in self._streamed_projects:
+            return
+        self._streamed_projects[project_name] = versions
+        
+        # 樹狀檢視中排在此專案之前的，是已插入且 API 順序較前的專案
+        index = bisect.bisect(self._streamed_positions, position)
+        self._streamed_positions.insert(index, position)
+        
+        # 與完整填充相同：版本數量超過門檻後改為延遲插入版本列
+        self._streamed_version_count += len(versions)
+        lazy = self._streamed_version_count > LAZY_TREE_THRESHOLD
+        if not lazy:
+            self._streamed_expanded = True
+        self._insert_project_rows(project_name, versions, lazy, index)
+    
+    def _fetch_projects_done(self, projects, message, streamed):
+        """獲取結束後更新專案資料並恢復重新整理按鈕"""
+        self.refresh_btn.configure(state='normal')
+        
+        if projects:
+            self._update_projects_data(projects, streamed)
+        else:
+            self.log_message(f"❌ {message}")
+            if streamed:
+                # 依現有的專案資料重建，不留下只插入一半的專案列
+                self.populate_projects_tree()
+        self._reset_streamed_projects()
+    
+    def _update_projects_data(self, projects, streamed=False):
+        """更新專案資料（streamed 表示各專案列已在獲取過程中逐步插入）"""
+        if streamed:
+            self.projects_data = projects
+            # 同名專案以最後一筆為準，與逐步插入的內容不同時才重建；
+            # 總數超過門檻時，先前以展開狀態插入的專案也要改為延遲載入
+            lazy = sum(map(len, projects.values())) > LAZY_TREE_THRESHOLD
+            if projects != self._streamed_projects or (lazy and self._streamed_expanded):
+                self.populate_projects_tree()
+        elif projects != self.projects_data:
+            self.projects_data = projects
+            self.populate_projects_tree()
+        # 資料未變動時樹狀檢視與選擇狀態都已是最新，不必重建所有列
         
-        total_versions = sum(len(versions) for versions in projects.values())
+        total_versions = sum(map(len, projects.values()))
         self.log_message(f"專案列表已更新: {len(projects)} 個專案, {total_versions} 個版本")
         
         # 保存到配置
@@ -821,8 +1264,7 @@ class ModularTMflowReportGeneratorUI:
         self.test_btn.configure(state='disabled')
         
         # 更新狀態為測試中
-        self.status_canvas.delete("all")
-        self.status_canvas.create_oval(2, 2, 10, 10, fill='#ffff00', outline='')
+        self.status_canvas.itemconfigure(self._status_dot, fill='#ffff00')
         
         # 更新 API 管理器的憑證
         self.api_manager.update_credentials(
@@ -849,8 +1291,7 @@ class ModularTMflowReportGeneratorUI:
     
     def disconnect_api(self):
         """斷開 API 連接"""
-        self.status_canvas.delete("all")
-        self.status_canvas.create_oval(2, 2, 10, 10, fill='#ff0000', outline='')
+        self.status_canvas.itemconfigure(self._status_dot, fill='#ff0000')
         
         self._update_connection_status(False)
         self.log_message("已斷開 API 連接")
@@ -862,8 +1303,7 @@ class ModularTMflowReportGeneratorUI:
         self.test_btn.configure(state='disabled')
         
         # 更新狀態為測試中
-        self.status_canvas.delete("all")
-        self.status_canvas.create_oval(2, 2, 10, 10, fill='#ffff00', outline='')
+        self.status_canvas.itemconfigure(self._status_dot, fill='#ffff00')
         
         # 更新 API 管理器的憑證
         self.api_manager.update_credentials(
@@ -881,12 +1321,11 @@ class ModularTMflowReportGeneratorUI:
         if success:
             self.root.after(0, self._connection_success)
         else:
-            self.root.after(0, lambda: self._connection_failed(message))
+            self.root.after(0, self._connection_failed, message)
     
     def _connection_success(self):
         """連接成功"""
-        self.status_canvas.delete("all")
-        self.status_canvas.create_oval(2, 2, 10, 10, fill='#00ff00', outline='')
+        self.status_canvas.itemconfigure(self._status_dot, fill='#00ff00')
         
         # 更新狀態文字和按鈕
         self._update_connection_status(True)
@@ -895,8 +1334,7 @@ class ModularTMflowReportGeneratorUI:
     
     def _connection_failed(self, error_message):
         """連接失敗"""
-        self.status_canvas.delete("all")
-        self.status_canvas.create_oval(2, 2, 10, 10, fill='#ff0000', outline='')
+        self.status_canvas.itemconfigure(self._status_dot, fill='#ff0000')
         
         # 更新狀態文字和按鈕
         self._update_connection_status(False)
@@ -908,6 +1346,9 @@ class ModularTMflowReportGeneratorUI:
     
     def browse_output_folder(self):
         """瀏覽輸出資料夾"""
+        # 只有選擇資料夾時才需要，延後導入以縮短啟動時間
+        from tkinter import filedialog
+        
         folder = filedialog.askdirectory(initialdir=self.output_path.get())
         if folder:
             self.output_path.set(folder)
@@ -917,17 +1358,23 @@ class ModularTMflowReportGeneratorUI:
     def generate_reports(self):
         """生成報告"""
         if self.is_generating:
-            messagebox.showwarning("警告", "報告正在生成中，請稍候...")
+            self.status_msg.set("報告正在生成中，請稍候...")
             return
         
         if not self.selected_versions:
-            messagebox.showwarning("警告", "請至少選擇一個版本")
+            self.status_msg.set("請至少選擇一個版本")
             return
         
-        if not self.standard_report.get() and not self.detailed_report.get():
-            messagebox.showwarning("警告", "請至少選擇一種報告類型")
+        # 一次讀取 Tk 變數，後續流程只使用快照值
+        want_standard = self.standard_report.get()
+        want_detailed = self.detailed_report.get()
+        
+        if not want_standard and not want_detailed:
+            self.status_msg.set("請至少選擇一種報告類型")
             return
         
+        self.status_msg.set("")
+        
         # 確保輸出目錄存在
         output_dir = self.output_path.get()
         try:
@@ -945,17 +1392,16 @@ class ModularTMflowReportGeneratorUI:
         
         # 準備報告類型
         report_types = []
-        if self.standard_report.get():
+        if want_standard:
             report_types.append("standard")
-        if self.detailed_report.get():
+        if want_detailed:
             report_types.append("detailed")
         
-        # 準備選中的版本資料
-        selected_version_data = []
-        for project_name, versions in self.projects_data.items():
-            for version_data in versions:
-                if version_data['version_id'] in self.selected_versions:
-                    selected_version_data.append(version_data)
+        # 準備選中的版本資料（版本索引依專案順序建立，單層走訪即可保持顯示順序）
+        selected_ids = self.selected_versions
+        selected_version_data = [version_data
+                                 for version_id, (_, version_data) in self._version_index.items()
+                                 if version_id in selected_ids]
         
         total_reports = len(selected_version_data) * len(report_types)
         self.log_message(f"開始生成報告: {len(selected_version_data)} 版本 × {len(report_types)} 類型 = {total_reports} 個報告")
@@ -965,42 +1411,73 @@ class ModularTMflowReportGeneratorUI:
         
         # 開始生成
         self.is_generating = True
-        self.generation_cancelled = False
-        self.generate_btn.configure(state='disabled', text='Generating...')
+        self._cancel_evt.clear()
+        # 生成期間按鈕改為取消，與連線按鈕切換 Reconnect/Disconnect 的方式相同
+        self.generate_btn.configure(text='Cancel', command=self.cancel_generation)
         
         # 在背景執行緒中生成報告
         threading.Thread(target=self._generate_reports_thread, 
                         args=(selected_version_data, report_types, output_dir), 
                         daemon=True).start()
     
+    def cancel_generation(self):
+        """取消報告生成：尚未開始的報告不再執行，執行中的報告完成後結束"""
+        self._cancel_evt.set()
+        self.generate_btn.configure(state='disabled', text='Cancelling...')
+        self.log_message("正在取消報告生成...")
+    
+    def _get_report_pool(self):
+        """取得常駐的報告生成執行緒池（重複生成時不必重新建立）"""
+        if self._report_pool is None:
+            self._report_pool = ThreadPoolExecutor(
+                max_workers=min(REPORT_MAX_WORKERS, os.cpu_count() or 1),
+                thread_name_prefix="report"
+            )
+        return self._report_pool
+    
     def _generate_reports_thread(self, selected_versions, report_types, output_dir):
-        """在背景執行緒中生成報告"""
+        """在背景執行緒中生成報告 - 各報告交由執行緒池並行處理"""
         try:
-            total_reports = len(selected_versions) * len(report_types)
             completed_reports = 0
             successful_reports = []
             failed_reports = []
             
+            pool = self._get_report_pool()
+            futures = {}
+            
+            # 整批報告共用一個時間戳記；同名版本再加序號避免檔名衝突
+            batch_timestamp = time.strftime(REPORT_TIMESTAMP_FORMAT)
+            name_counts = collections.Counter()
+            
             for version_data in selected_versions:
-                if self.generation_cancelled:
-                    break
-                
                 version = version_data['version']
                 version_id = version_data['version_id']
                 
-                self.root.after(0, lambda v=version: self.log_message(f"📄 正在處理版本: {v}"))
-                
                 for report_type in report_types:
-                    if self.generation_cancelled:
-                        break
+                    report_suffix = REPORT_SUFFIXES[report_type]
                     
-                    report_suffix = "Standard" if report_type == "standard" else "Detailed"
-                    self.root.after(0, lambda s=report_suffix: self.log_message(f"⚙️ 生成 {s} 報告..."))
+                    name_counts[(version, report_type)] += 1
+                    count = name_counts[(version, report_type)]
+                    timestamp = batch_timestamp if count == 1 else f"{batch_timestamp}_{count}"
                     
-                    # 生成報告
-                    success, result = self.report_generator.generate_single_report(
-                        version, version_id, report_type, output_dir
-                    )
+                    future = pool.submit(self._run_report_job,
+                                         version, version_id, report_type, output_dir, timestamp)
+                    futures[future] = (version, report_suffix)
+            
+            total_reports = len(futures)
+            pending = set(futures)
+            cancelled_reports = 0
+            cancel_handled = False
+            
+            while pending:
+                # 短暫等待，讓取消可在 200ms 內生效
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    version, report_suffix = futures[future]
+                    success, result = future.result()
                     
                     completed_reports += 1
                     progress = int((completed_reports / total_reports) * 100)
@@ -1008,36 +1485,87 @@ class ModularTMflowReportGeneratorUI:
                     if success:
                         successful_reports.append(result)
                         filename = os.path.basename(result)
-                        self.root.after(0, lambda f=filename: self.log_message(f"報告生成成功: {f}"))
+                        self._post_log(f"報告生成成功: {filename}")
                     else:
                         failed_reports.append(f"{version}_{report_suffix}")
-                        self.root.after(0, lambda v=version, s=report_suffix, e=result: 
-                                      self.log_message(f"❌ 報告生成失敗: {v}_{s} - {e}"))
+                        self._post_log(f"❌ 報告生成失敗: {version}_{report_suffix} - {result}")
                     
                     # 更新進度
-                    self.root.after(0, lambda p=progress: self._update_progress(p))
+                    self._post_progress(progress)
+                
+                if self._cancel_evt.is_set() and not cancel_handled:
+                    # 取消尚未開始的報告；執行中的報告無法中斷，繼續等待其完成
+                    cancel_handled = True
+                    cancelled_reports = sum(future.cancel() for future in pending)
+                    self._post_log(f"⏹️ 已取消 {cancelled_reports} 個尚未開始的報告")
             
             # 生成完成
-            self.root.after(0, lambda: self._generation_complete(successful_reports, failed_reports))
+            self.root.after(0, self._generation_complete, successful_reports, failed_reports,
+                            cancelled_reports)
             
         except Exception as e:
-            self.root.after(0, lambda: self.log_message(f"❌ 生成過程發生錯誤: {e}"))
-            self.root.after(0, lambda: self._generation_complete([], []))
+            self._post_log(f"❌ 生成過程發生錯誤: {e}")
+            self.root.after(0, self._generation_complete, [], [])
+    
+    def _run_report_job(self, version, version_id, report_type, output_dir, timestamp):
+        """在執行緒池中生成單一報告，開始執行時才寫入日誌以反映實際進度"""
+        self._post_log(f"⚙️ 正在生成 {version} {REPORT_SUFFIXES[report_type]} 報告...")
+        return self.report_generator.generate_single_report(
+            version, version_id, report_type, output_dir, timestamp
+        )
+    
+    def _post_log(self, message):
+        """排入日誌訊息（可從任意執行緒呼叫），合併到下一次刷新"""
+        self._log_queue.append(f"[{_log_timestamp()}] {message}\n")
+        self._schedule_ui_flush()
+    
+    def _post_progress(self, progress):
+        """記錄最新進度（可從任意執行緒呼叫），中間值會被合併"""
+        self._pending_progress = progress
+        self._schedule_ui_flush()
+    
+    def _schedule_ui_flush(self):
+        """每 30ms 最多排程一次 UI 刷新"""
+        if not self._ui_flush_pending:
+            self._ui_flush_pending = True
+            self.root.after(30, self._flush_ui_updates)
+    
+    def _flush_ui_updates(self):
+        """一次寫入所有累積的日誌，並只套用最新的進度"""
+        self._ui_flush_pending = False
+        
+        entries = []
+        while self._log_queue:
+            entries.append(self._log_queue.popleft())
+        if entries:
+            self._append_log_text("".join(entries))
+        
+        progress, self._pending_progress = self._pending_progress, None
+        if progress is not None:
+            self._update_progress(progress)
     
     def _update_progress(self, progress):
         """更新進度"""
         self.progress_var.set(progress)
         self.progress_label.configure(text=f"{progress}%")
     
-    def _generation_complete(self, successful_reports, failed_reports):
+    def _generation_complete(self, successful_reports, failed_reports, cancelled_reports=0):
         """生成完成"""
+        # 先寫入尚未刷新的日誌與進度，確保完成訊息排在最後
+        self._flush_ui_updates()
         self.is_generating = False
-        self.generate_btn.configure(state='normal', text='Generate Reports')
+        self.generate_btn.configure(state='normal', text='Generate Reports',
+                                    command=self.generate_reports)
         
         total_success = len(successful_reports)
         total_failed = len(failed_reports)
         
-        if total_failed == 0:
+        if self._cancel_evt.is_set():
+            self.log_message(f"⏹️ 報告生成已取消：成功 {total_success} 個，失敗 {total_failed} 個，"
+                             f"取消 {cancelled_reports} 個")
+            messagebox.showinfo("已取消", f"成功生成 {total_success} 個報告\n"
+                                         f"失敗 {total_failed} 個報告\n取消 {cancelled_reports} 個報告")
+        elif total_failed == 0:
             self.log_message("🎉 所有報告生成完成！")
             messagebox.showinfo("完成", f"成功生成 {total_success} 個報告！")
         else:
@@ -1051,7 +1579,21 @@ class ModularTMflowReportGeneratorUI:
             self._update_progress(0)
     
     def save_config(self):
-        """儲存配置"""
+        """排程儲存配置，SAVE_CONFIG_DELAY_MS 內的多次變更只寫入一次"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(SAVE_CONFIG_DELAY_MS, self._save_config_now)
+    
+    def _save_config_now(self, sync=False):
+        """立即儲存配置
+        
+        配置在主執行緒組好後交由背景寫入執行緒序列化與寫檔；sync 為 True 時
+        （關閉視窗）改在目前執行緒寫入並等待完成。
+        """
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        
         # 準備配置資料
         config = {
             "API_TOKEN": self.api_token.get(),
@@ -1064,50 +1606,94 @@ class ModularTMflowReportGeneratorUI:
             "PROJECTS_DATA": {}
         }
         
-        # 準備選中的版本資料
+        # 單次走訪同時準備專案資料與選中的版本資料（選擇依專案順序保存）
+        selected_entries = config["SELECTED_VERSIONS"]
+        selected_ids = self.selected_versions
         for project_name, versions in self.projects_data.items():
+            project_entries = []
             for version_data in versions:
-                if version_data['version_id'] in self.selected_versions:
-                    config["SELECTED_VERSIONS"].append({
+                version_id = version_data['version_id']
+                is_selected = version_id in selected_ids
+                if is_selected:
+                    selected_entries.append({
                         "project": project_name,
                         "version": version_data['version'],
-                        "version_id": version_data['version_id']
+                        "version_id": version_id
                     })
-        
-        # 準備專案資料
-        for project_name, versions in self.projects_data.items():
-            config["PROJECTS_DATA"][project_name] = []
-            for version_data in versions:
-                config["PROJECTS_DATA"][project_name].append({
+                project_entries.append({
                     "version": version_data['version'],
                     "project_id": version_data['project_id'],
-                    "version_id": version_data['version_id'],
+                    "version_id": version_id,
                     "created": version_data.get('created', ''),
-                    "selected": version_data['version_id'] in self.selected_versions
+                    "selected": is_selected
                 })
+            config["PROJECTS_DATA"][project_name] = project_entries
+        
+        # 儲存配置：只保留最新一份待寫入的配置
+        self.config = config
+        self._cfg_pending = config
+        if sync:
+            self._write_pending_config()
+            return
         
-        # 儲存配置
-        if self.config_manager.save_config(config):
-            self.config = config
+        if self._cfg_writer is None:
+            self._cfg_writer = threading.Thread(target=self._cfg_writer_loop,
+                                                name="config-writer", daemon=True)
+            self._cfg_writer.start()
+        self._cfg_event.set()
+    
+    def _cfg_writer_loop(self):
+        """背景寫入執行緒：每次被喚醒時寫入最新的待寫入配置"""
+        while True:
+            self._cfg_event.wait()
+            self._cfg_event.clear()
+            self._write_pending_config()
+    
+    def _write_pending_config(self):
+        """寫入待寫入的配置；以鎖確保較舊的配置不會覆蓋較新的配置"""
+        with self._cfg_write_lock:
+            config, self._cfg_pending = self._cfg_pending, None
+            if config is not None:
+                self.config_manager.save_config(config)
     
     def log_message(self, message):
-        """記錄訊息到日誌"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_entry)
+        """記錄訊息到日誌（經由佇列合併寫入，不強制立即重繪）"""
+        self._post_log(message)
+    
+    def _append_log_text(self, text):
+        """寫入日誌區，超過 LOG_MAX_LINES 時刪除最舊的行"""
+        self.log_text.insert(tk.END, text)
+        self._log_line_count += text.count("\n")
+        
+        excess = self._log_line_count - LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_line_count = LOG_MAX_LINES
+        
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
     
     def on_closing(self):
         """應用程式關閉時的處理"""
         if self.is_generating:
             if messagebox.askokcancel("確認關閉", "報告正在生成中，確定要關閉應用程式嗎？"):
-                self.generation_cancelled = True
-                self.save_config()
-                self.root.destroy()
+                if self._report_pool is not None:
+                    self._report_pool.shutdown(wait=False, cancel_futures=True)
+                self._save_config_now(sync=True)
+                self._close_window()
+                # 執行中的報告無法取消，且執行緒池的工作執行緒會讓直譯器等待它們結束；
+                # 配置已同步寫入，直接結束行程，避免視窗關閉後程式仍在背景執行
+                for stream in (sys.stdout, sys.stderr):
+                    if stream is not None:  # PyInstaller --windowed 時為 None
+                        stream.flush()
+                os._exit(0)
         else:
-            self.save_config()
-            self.root.destroy()
+            self._save_config_now(sync=True)
+            self._close_window()
+    
+    def _close_window(self):
+        """移除日誌轉送並關閉視窗"""
+        logging.getLogger("finite_state_reporter").removeHandler(self._reporter_log_handler)
+        self.root.destroy()
 
 def main():
     root = tk.Tk()